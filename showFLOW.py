@@ -9,6 +9,12 @@ It prints FLOWs in ASBCE that have not received audio packets.
 
 import asyncio
 import logging
+import sys
+
+try:
+    from orjson import loads as _jloads
+except ImportError:
+    from json import loads as _jloads
 
 logger = logging.getLogger(__name__)
 
@@ -16,9 +22,12 @@ import netifaces as ni
 import json
 import re
 import os
+import subprocess
 from asyncio import Queue
+from sys import intern as _intern
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from platform import node
 from typing import Any, List, Dict, Optional
 
@@ -30,12 +39,12 @@ RE_FLOW = (
     r"(?P<InSrcIP>[\d+.]*):",
     r"(?P<InSrcPort>\d+) -> ",
     r"(?P<InDstIP>[\d+.]*):",
-    r"(?P<InDstPort>\d+)\] .*OUT ",
+    r"(?P<InDstPort>\d+)\] [^\n]*?OUT ",
     r"(?P<OutIf>\d+) RELAY ",
     r"(?P<OutSrcIP>[\d+.]*):",
     r"(?P<OutSrcPort>\d+) -> ",
     r"(?P<OutDstIP>[\d+.]*):",
-    r"(?P<OutDstPort>\d+).*in VLAN ",
+    r"(?P<OutDstPort>\d+)[^\n]*?in VLAN ",
     r"(?P<InVlan>\w+) out VLAN ",
     r"(?P<OutVlan>\w+) Enc ",
     r"(?P<Enc>\w+) Dec ",
@@ -47,17 +56,75 @@ RE_FLOW = (
     r"(?P<Ech>\w+)",
 )
 
-reFLOW = re.compile("".join(RE_FLOW))
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+reFLOW = _re_engine.compile(("^" + "".join(RE_FLOW)).encode(), re.ASCII | re.MULTILINE)
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
-def hex_to_dec(_str: str) -> int:
+_hsdb = None
+if hyperscan is not None:
     try:
-        return int(_str, 16)
-    except ValueError:
-        return 0
+        _hsdb = hyperscan.Database()
+        _hsdb.compile(
+            expressions=[re.sub(r"\(\?P<\w+>", "(", "^" + "".join(RE_FLOW)).encode()],
+            ids=[1],
+            flags=[hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SOM_LEFTMOST],
+        )
+    except hyperscan.error:
+        _hsdb = None
+
+
+def _iter_flow_matches(text):
+    """Yields reFLOW matches, letting the Hyperscan DFA locate candidate
+    lines first when the bindings are available so the backtracking
+    engine only runs group extraction on confirmed matches."""
+    if _hsdb is None:
+        yield from reFLOW.finditer(text)
+        return
+    starts = set()
+    _hsdb.scan(text,
+               match_event_handler=lambda _i, s, _e, _f, _c: starts.add(s))
+    for start in sorted(starts):
+        m = reFLOW.match(text, start)
+        if m:
+            yield m
+
+FLOW_GROUPS = (
+    'InIf', 'InSrcIP', 'InSrcPort', 'InDstIP', 'InDstPort',
+    'OutIf', 'OutSrcIP', 'OutSrcPort', 'OutDstIP', 'OutDstPort',
+    'InVlan', 'OutVlan', 'Enc', 'Dec', 'Snt', 'Drp', 'Rx', 'Rly', 'Ech',
+)
 
 
-@dataclass
+_HEX = {ord(c): i for i, c in enumerate("0123456789abcdef")}
+_HEX.update({ord(c): i for i, c in enumerate("0123456789ABCDEF")})
+
+_hex_cache: Dict[bytes, int] = {}
+
+
+def hex_to_dec(_str: bytes) -> int:
+    if _str == b"0":
+        return 0
+    n = _hex_cache.get(_str)
+    if n is not None:
+        return n
+    n = 0
+    get = _HEX.get
+    for c in _str:
+        n = (n << 4) | get(c, 0)
+    if len(_hex_cache) < 4096:
+        _hex_cache[_str] = n
+    return n
+
+
+@dataclass(slots=True, frozen=True)
 class Flow:
     InIf: int
     InSrcIP: str
@@ -81,33 +148,32 @@ class Flow:
     timestamp: datetime
 
     @classmethod
-    def from_regex(cls, match_dict: Dict[str, str], timestamp: datetime) -> 'Flow':
-        """Create Flow from regex match dict with string values."""
+    def from_tuple(cls, groups: tuple, timestamp: datetime) -> 'Flow':
+        """Create Flow from the regex groups tuple, in RE_FLOW group order."""
+        _int = int
+        _hex = hex_to_dec
         return cls(
-            InIf=int(match_dict['InIf']),
-            InSrcIP=match_dict['InSrcIP'],
-            InSrcPort=int(match_dict['InSrcPort']),
-            InDstIP=match_dict['InDstIP'],
-            InDstPort=int(match_dict['InDstPort']),
-            OutIf=int(match_dict['OutIf']),
-            OutSrcIP=match_dict['OutSrcIP'],
-            OutSrcPort=int(match_dict['OutSrcPort']),
-            OutDstIP=match_dict['OutDstIP'],
-            OutDstPort=int(match_dict['OutDstPort']),
-            InVlan=int(match_dict['InVlan']),
-            OutVlan=int(match_dict['OutVlan']),
-            Enc=hex_to_dec(match_dict['Enc']),
-            Dec=hex_to_dec(match_dict['Dec']),
-            Snt=hex_to_dec(match_dict['Snt']),
-            Drp=hex_to_dec(match_dict['Drp']),
-            Rx=hex_to_dec(match_dict['Rx']),
-            Rly=hex_to_dec(match_dict['Rly']),
-            Ech=hex_to_dec(match_dict['Ech']),
-            timestamp=timestamp
+            _int(groups[0]), _intern(groups[1].decode()), _int(groups[2]),
+            _intern(groups[3].decode()), _int(groups[4]),
+            _int(groups[5]), _intern(groups[6].decode()), _int(groups[7]),
+            _intern(groups[8].decode()), _int(groups[9]),
+            _int(groups[10]), _int(groups[11]),
+            _hex(groups[12]), _hex(groups[13]), _hex(groups[14]),
+            _hex(groups[15]), _hex(groups[16]), _hex(groups[17]),
+            _hex(groups[18]),
+            timestamp
+        )
+
+    @classmethod
+    def from_regex(cls, match_dict: Dict[str, bytes], timestamp: datetime) -> 'Flow':
+        """Create Flow from a regex match dict with bytes values, as
+        produced by matching reFLOW against the raw showflow line."""
+        return cls.from_tuple(
+            tuple(match_dict[name] for name in FLOW_GROUPS), timestamp
         )
 
     def is_rtcp(self) -> bool:
-        return self.InSrcPort % 2 == 1 and self.InDstPort % 2 == 1
+        return bool(self.InSrcPort & 1 and self.InDstPort & 1)
 
     @property
     def in_leg(self):
@@ -118,32 +184,131 @@ class Flow:
         return self.OutSrcIP, self.OutSrcPort, self.OutDstIP, self.OutDstPort
 
 
-def parse_showflow_310(output: str, timestamp: datetime, no_rtcp: bool = True) -> List[Flow]:
+def _flow_from_tokens(tokens: List[bytes], timestamp: datetime,
+                      no_rtcp: bool = True,
+                      rx_zero_only: bool = False) -> Optional['Flow']:
+    """Builds a Flow from a whitespace-split showflow line.
+
+    Fields are keyword-separated in the `showflow` output so plain list
+    indexing is enough, no regex backtracking needed. Raises IndexError
+    or ValueError on lines that do not follow the expected layout.
+    Returns None for flows excluded by the no_rtcp/rx_zero_only filters
+    without paying for a Flow construction.
+    """
+    if tokens[2] != b'->' or tokens[-2] != b'ECH':
+        raise ValueError(f"unexpected line layout: {tokens[:4]}")
+    InSrcIP, _, InSrcPort = tokens[1].lstrip(b'[').rpartition(b':')
+    InDstIP, _, InDstPort = tokens[3].rstrip(b']').rpartition(b':')
+    InSrcPort = int(InSrcPort)
+    InDstPort = int(InDstPort)
+    if no_rtcp and InSrcPort & 1 and InDstPort & 1:
+        return None
+    Rx = hex_to_dec(tokens[-5])
+    if rx_zero_only and Rx:
+        return None
+    o = tokens.index(b'OUT')
+    OutSrcIP, _, OutSrcPort = tokens[o + 3].rpartition(b':')
+    OutDstIP, _, OutDstPort = tokens[o + 5].rpartition(b':')
+    return Flow(
+        InIf=int(tokens[0]),
+        InSrcIP=_intern(InSrcIP.decode()),
+        InSrcPort=InSrcPort,
+        InDstIP=_intern(InDstIP.decode()),
+        InDstPort=InDstPort,
+        OutIf=int(tokens[o + 1]),
+        OutSrcIP=_intern(OutSrcIP.decode()),
+        OutSrcPort=int(OutSrcPort),
+        OutDstIP=_intern(OutDstIP.decode()),
+        OutDstPort=int(OutDstPort),
+        InVlan=int(tokens[-18]),
+        OutVlan=int(tokens[-15]),
+        Enc=hex_to_dec(tokens[-13]),
+        Dec=hex_to_dec(tokens[-11]),
+        Snt=hex_to_dec(tokens[-9]),
+        Drp=hex_to_dec(tokens[-7]),
+        Rx=Rx,
+        Rly=hex_to_dec(tokens[-3]),
+        Ech=hex_to_dec(tokens[-1]),
+        timestamp=timestamp
+    )
+
+
+def parse_showflow_310(output: bytes, timestamp: datetime, no_rtcp: bool = True,
+                       rx_zero_only: bool = False) -> List[Flow]:
     """
     Parses the output of the `showflow 310 dynamic` command.
 
     Args:
-        output (str): The output string from the command.
+        output (bytes): The raw output of the command; str is
+            accepted and encoded for convenience.
         no_rtcp (bool): If True, RTCP flows will be excluded.
+        rx_zero_only (bool): If True, only flows with Rx == 0 are kept.
 
     Returns:
         List[Flow]: A list of Flow objects containing flow information.
     """
+    if isinstance(output, str):
+        output = output.encode()
     flows = []
+    failed = []
+    _from_tokens = _flow_from_tokens
+    flows_append = flows.append
+    failed_append = failed.append
     for line in output.splitlines():
-        m = reFLOW.match(line)
-        if m:
-            flow = Flow.from_regex(m.groupdict(), timestamp)
-            if not no_rtcp or not flow.is_rtcp():
-                flows.append(flow)
-        else:
-            logger.warning(f"Line did not match expected format: {line}")
+        if not line or not 48 <= line[0] <= 57:
+            continue
+        try:
+            flow = _from_tokens(line.split(), timestamp, no_rtcp, rx_zero_only)
+        except (IndexError, ValueError):
+            failed_append(line)
+            continue
+        if flow is not None:
+            flows_append(flow)
+    if failed:
+        matched = 0
+        for m in _iter_flow_matches(b"\n".join(failed)):
+            matched += 1
+            g = m.groups()
+            if no_rtcp and int(g[2]) & 1 and int(g[4]) & 1:
+                continue
+            if rx_zero_only and hex_to_dec(g[16]):
+                continue
+            flows.append(Flow.from_tuple(g, timestamp))
+        if matched < len(failed):
+            logger.warning("%d lines did not match expected format", len(failed) - matched)
     return flows
 
 ################################ END FLOW_PARSER ##############################
 ################################ BEGIN SBCE ###################################
 
-@dataclass
+_RE_EMS = re.compile(r"--ems-node-ip=(?P<ems_ip>\d+(?:\.\d+){3})")
+
+
+def _ssyndi_cmdline():
+    """str: Returns the command line of the ssyndi process.
+
+    Scans /proc directly, which avoids forking a shell and ps; falls
+    back to ps when /proc is not readable.
+    """
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/comm") as handle:
+                if handle.read().strip() != "ssyndi":
+                    continue
+            with open(f"/proc/{pid}/cmdline", "rb") as handle:
+                return handle.read().replace(b"\0", b" ").decode()
+        except OSError:
+            continue
+
+    proc = subprocess.run(
+        ["ps", "--columns", "999", "-f", "-C", "ssyndi"],
+        capture_output=True, text=True
+    )
+    return proc.stdout
+
+@dataclass(slots=True, frozen=True)
 class Server(object):
     """SBCE Server object"""
     server_config_name: str
@@ -151,7 +316,7 @@ class Server(object):
     server_address: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MediaInterface(object):
     """SBCE Media Interface object"""
     media_name: str
@@ -175,6 +340,7 @@ class SBCE(object):
         self._media_ifaces = None
         self._servers = None
         self._sysinfo = None
+        self._sysinfo_dict = None
         self._version = None
         self._hostname = None
         self._hw_type = None
@@ -185,8 +351,7 @@ class SBCE(object):
         if self._ems_ip is not None:
             return self._ems_ip
 
-        output = os.popen("ps --columns 999 -f -C ssyndi").read()
-        m = re.search(r"--ems-node-ip=(?P<ems_ip>\d+(?:\.\d+){3})", output)
+        m = _RE_EMS.search(_ssyndi_cmdline())
 
         ems_ip = m["ems_ip"] if m else ""
         self._ems_ip = ems_ip
@@ -198,8 +363,8 @@ class SBCE(object):
         if self._hw_type is not None:
             return self._hw_type
 
-        m = re.search(r"HARDWARE=(.*)\n", self.sysinfo)
-        hw_type = int(m.group(1)) if m and m.group(1).isdigit() else None
+        value = self._sysinfo_field("HARDWARE")
+        hw_type = int(value) if value.isdigit() else None
         self._hw_type = hw_type
 
         return hw_type
@@ -212,9 +377,25 @@ class SBCE(object):
         if self._ifaces is not None:
             return self._ifaces
 
+        try:
+            proc = subprocess.run(
+                ["ip", "-j", "addr"], capture_output=True, text=True
+            )
+            if proc.returncode == 0:
+                ifaces = {
+                    addr["local"]: link["ifname"]
+                    for link in _jloads(proc.stdout)
+                    for addr in link.get("addr_info", [])
+                    if "local" in addr
+                }
+                self._ifaces = ifaces
+                return ifaces
+        except (OSError, ValueError):
+            pass
+
         ifaces = {
-            ifaddr["addr"]: iface 
-            for iface in ni.interfaces() 
+            ifaddr["addr"]: iface
+            for iface in ni.interfaces()
             for family in [ni.AF_INET, ni.AF_INET6]
             for ifaddr in ni.ifaddresses(iface).get(family, [])
         }
@@ -233,7 +414,7 @@ class SBCE(object):
 
         if json_res:
             try:
-                media_data = json.loads(json_res)
+                media_data = _jloads(json_res)
                 media_ifaces = [
                     MediaInterface(
                         media_name=entry.get("media_name", ""),
@@ -245,8 +426,8 @@ class SBCE(object):
                 ]
                 self._media_ifaces = media_ifaces
                 return media_ifaces
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON result: {json_res} - {e}")
+            except ValueError as e:
+                logger.error("Failed to parse JSON result: %s - %s", json_res, e)
                 self._media_ifaces = []
         return []
 
@@ -260,15 +441,38 @@ class SBCE(object):
             self._sysinfo = handle.read()
         return self._sysinfo
 
+    def _sysinfo_field(self, key):
+        """str: Returns one key=value field of the sysinfo file.
+
+        The file is parsed into a dict on first use so the properties
+        derived from it each cost a dict lookup instead of their own
+        regex pass over the whole file.
+        """
+        if self._sysinfo_dict is None:
+            try:
+                text = self.sysinfo
+            except OSError:
+                # Missing or unreadable sysinfo: cache the empty result
+                # so later property accesses do not retry the open
+                self._sysinfo = ""
+                text = ""
+            self._sysinfo_dict = {
+                k.strip(): v.strip()
+                for k, sep, v in (
+                    line.partition("=") for line in text.splitlines()
+                )
+                if sep
+            }
+        return self._sysinfo_dict.get(key, "")
+
     @property
     def version(self):
         """str: Returns the software version of the SBCE in short format."""
         if self._version is not None:
             return self._version
 
-        m = re.search("VERSION=(.*)\n", self.sysinfo)
-        version = m.group(1) if m else ""
-        self._version = version 
+        version = self._sysinfo_field("VERSION")
+        self._version = version
         return version
 
     @property
@@ -282,8 +486,7 @@ class SBCE(object):
             self._hostname = hostname
             return hostname
 
-        m = re.search(r"ApplianceName=(.*)\n", self.sysinfo)
-        hostname = m.group(1) if m else ""
+        hostname = self._sysinfo_field("ApplianceName")
         self._hostname = hostname
         return hostname
 
@@ -300,7 +503,7 @@ class SBCE(object):
 
         if json_res:
             try:
-                servers_data = json.loads(json_res)
+                servers_data = _jloads(json_res)
                 servers = [
                     Server(
                         server_config_name=entry.get("server_config_name", ""),
@@ -311,21 +514,32 @@ class SBCE(object):
                 ]
                 self._servers = servers
                 return servers
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON result: {json_res} - {e}")
+            except ValueError as e:
+                logger.error("Failed to parse JSON result: %s - %s", json_res, e)
                 self._servers = []
         return []
 
+
+    async def prepare(self):
+        """Caches sysinfo and the properties derived from it off the
+        event loop so later accesses are plain attribute reads."""
+        def _warm():
+            _ = self.sysinfo
+            _ = self.version
+            _ = self.hw_type
+            _ = self.hostname
+        await asyncio.to_thread(_warm)
+
     def _exec_sql(self, sql):
         fmt = f"SELECT json_agg(row_to_json(t)) FROM ({sql}) AS t;"
-        psql_cmd = f'psql -t -U postgres sbcedb -c "{fmt}"'
+        psql_cmd = ["psql", "-t", "-U", "postgres", "sbcedb", "-c", fmt]
         try:
-            command = os.popen(psql_cmd)
-            output = command.read().strip()
-            exit_status = command.close()
-            return output if exit_status is None else ""
+            proc = subprocess.run(
+                psql_cmd, capture_output=True, text=True, timeout=10
+            )
+            return proc.stdout.strip() if proc.returncode == 0 else ""
         except Exception as e:
-            logger.error(f"Failed to execute SQL command: {psql_cmd} - {e}")
+            logger.error("Failed to execute SQL command: %s - %s", psql_cmd, e)
             return ""
 
 ################################# END SBCE ####################################
@@ -334,7 +548,7 @@ class SBCE(object):
 class CommandResult:
     """A consistent container for command output."""
 
-    stdout: str
+    stdout: bytes
     stderr: str
     returncode: Optional[int]
     name: Optional[str]
@@ -342,7 +556,7 @@ class CommandResult:
 
     def __init__(
         self,
-        stdout: str,
+        stdout: bytes,
         stderr: str,
         returncode: Optional[int],
         name: Optional[str] = None,
@@ -371,79 +585,151 @@ class CommandResult:
         return f"CommandResult({', '.join(fields)})"
 
 
+FRAME_END = "__FRAME_END__"
+
+# Prebuilt format templates so the per-flow print path reuses the parsed
+# format specs instead of re-evaluating two f-strings per flow.
+INSIDE_FMT = "{0} (Rx {1}) {2:>15}:{3:<5} <= {4:>5}:{5:<15}".format
+OUTSIDE_FMT = "{0:>15}:{1:<5} <= {2:>5}:{3:<15} (Rly {4}) {5}".format
+REPORT_FMT = "{0:%Y-%m-%d@%H:%M:%S}   {1}".format
+
+
 async def showflows(queue, sbce, level=7, sleep=2)  :
     cmd = f"showflow {sbce.hw_type} dynamic {level}"
+    script = f"while true; do {cmd}; echo {FRAME_END}; sleep {sleep}; done"
     while True:
         try:
-            proc = await asyncio.create_subprocess_shell(
-                cmd,
+            proc = await asyncio.create_subprocess_exec(
+                "sh", "-c", script,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
 
-            stdout_bytes, stderr_bytes = await proc.communicate()
-            stdout_text = stdout_bytes.decode(errors="replace").strip()
-            stderr_text = stderr_bytes.decode(errors="replace").strip()
-                        
-            if proc.returncode == 0 and stdout_text:
-                commandresult = CommandResult(
-                    stdout=stdout_text,
-                    stderr=stderr_text,
-                    returncode=proc.returncode,
-                    timestamp=datetime.now(),
-                    name=cmd
-                )
-                await queue.put(commandresult)
-            else:
-                logger.debug("No flows")
+            async def drain_stderr(stream):
+                # Keep stderr drained so the shell never blocks on a
+                # full pipe buffer, and surface whatever showflow
+                # complains about; chunked reads sidestep the
+                # StreamReader line-length limit
+                while True:
+                    err_bytes = await stream.read(4096)
+                    if not err_bytes:
+                        break
+                    err = err_bytes.strip()
+                    if err:
+                        logger.error(
+                            "showflow: %s", err.decode(errors="replace")
+                        )
+
+            stderr_task = asyncio.create_task(drain_stderr(proc.stderr))
+
+            frame_end = FRAME_END.encode()
+            lines = []
+            async for line_bytes in proc.stdout:
+                line = line_bytes.rstrip()
+                if line == frame_end:
+                    stdout_text = b"\n".join(lines)
+                    lines = []
+                    if stdout_text:
+                        commandresult = CommandResult(
+                            stdout=stdout_text,
+                            stderr="",
+                            returncode=0,
+                            timestamp=datetime.now(),
+                            name=cmd
+                        )
+                        await queue.put(commandresult)
+                    else:
+                        logger.debug("No flows")
+                elif line:
+                    lines.append(line)
+            await proc.wait()
+            await stderr_task
+            logger.error("showflow loop exited with code %s", proc.returncode)
             await asyncio.sleep(sleep)
         except Exception as e:
-            logger.error(f"{repr(e)}")
+            logger.error("%r", e)
 
 
 async def analyze_flows(queue, sbce):
     prev = set()
     curr = set()
-    while True:
-        commandresult = await queue.get()
-        if commandresult.stderr:
-            logger.error(f"Error in item {commandresult}")
-            continue
 
-        flows = parse_showflow_310(
-            commandresult.stdout,
-            timestamp=commandresult.timestamp
-        )
+    @lru_cache(maxsize=64)
+    def iface_of(ip):
+        return sbce.ifaces.get(ip, "??")
 
-        curr.clear()
-        for flow in flows:
-            InSrcIP, InSrcPort, InDstIP, InDstPort = flow.in_leg
-            InIface = sbce.ifaces.get(InDstIP, "??")
-            OutSrcIP, OutSrcPort, OutDstIP, OutDstPort = flow.out_leg
-            OutIface = sbce.ifaces.get(OutSrcIP, "??")
-            if InSrcIP == "0.0.0.0" or OutDstIP == "0.0.0.0":
+    while True:
+        items = [await queue.get()]
+        # Drain any backlog so a burst of frames is handled in one wakeup
+        # instead of one scheduler round-trip per frame. Frames are still
+        # parsed in order; concatenating them would break the prev/curr
+        # zero-Rx comparison.
+        while True:
+            try:
+                items.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        for commandresult in items:
+            if commandresult.stderr:
+                logger.error("Error in item %s", commandresult)
                 continue
-            if flow.Rx == 0:
-                inside = f"{InIface} (Rx {flow.Rx}) {InDstIP:>15}:{InDstPort:<5} <= {InSrcPort:>5}:{InSrcIP:<15}"
-                outside = f"{OutDstIP:>15}:{OutDstPort:<5} <= {OutSrcPort:>5}:{OutSrcIP:<15} (Rly {flow.Rly}) {OutIface}"
-                zerorx_flow = f"{outside}-SBCE-{inside}"
-                curr.add(zerorx_flow)
-                if zerorx_flow in prev:
-                    print(f"{flow.timestamp:%Y-%m-%d@%H:%M:%S}   {zerorx_flow}")
-        prev = set(curr)
+
+            flows = parse_showflow_310(
+                commandresult.stdout,
+                timestamp=commandresult.timestamp,
+                rx_zero_only=True
+            )
+
+            curr.clear()
+            report = []
+            curr_add = curr.add
+            report_append = report.append
+            for flow in flows:
+                InSrcIP = flow.InSrcIP
+                InSrcPort = flow.InSrcPort
+                InDstIP = flow.InDstIP
+                InDstPort = flow.InDstPort
+                InIface = iface_of(InDstIP)
+                OutSrcIP = flow.OutSrcIP
+                OutSrcPort = flow.OutSrcPort
+                OutDstIP = flow.OutDstIP
+                OutDstPort = flow.OutDstPort
+                OutIface = iface_of(OutSrcIP)
+                if InSrcIP == "0.0.0.0" or OutDstIP == "0.0.0.0":
+                    continue
+                if flow.Rx == 0:
+                    inside = INSIDE_FMT(InIface, flow.Rx, InDstIP, InDstPort,
+                                        InSrcPort, InSrcIP)
+                    outside = OUTSIDE_FMT(OutDstIP, OutDstPort, OutSrcPort,
+                                          OutSrcIP, flow.Rly, OutIface)
+                    zerorx_flow = outside + "-SBCE-" + inside
+                    curr_add(zerorx_flow)
+                    if zerorx_flow in prev:
+                        report_append(REPORT_FMT(flow.timestamp, zerorx_flow))
+            if report:
+                sys.stdout.write("\n".join(report) + "\n")
+            prev = set(curr)
 
 
 async def main():
     """Main function for showFLOW application."""
 
     sbce = SBCE()
-    queue = Queue()
+    # Prewarm the lazy SBCE properties off the event loop so the first
+    # flow analysis never blocks on a subprocess or file read.
+    await asyncio.gather(
+        sbce.prepare(),
+        asyncio.to_thread(lambda: sbce.ifaces),
+        asyncio.to_thread(lambda: sbce.media_ifaces),
+        asyncio.to_thread(lambda: sbce.servers),
+    )
+    queue = Queue(maxsize=2)
     analyzer = asyncio.create_task(analyze_flows(queue, sbce))
     collector = asyncio.create_task(showflows(queue, sbce))
     try:
         await asyncio.gather(analyzer, collector)
     except Exception as e:
-        logger.error("Exception {e}")
+        logger.error("Exception %s", e)
 
 
 ################################ END MAIN #####################################
@@ -1,5 +1,5 @@
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SIPMessage:
     """Represents a parsed SIP message from trace log."""
     timestamp: str
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+"""
+Optional helper that AOT-compiles the flow parser with mypyc.
+
+The parser is a tight, fully type-annotated loop, so mypyc can turn it
+into a C extension with native ints for the port/counter fields. The
+compiled flow.*.so sits next to flow.py and is picked up automatically
+by `from flow import ...` since extension modules shadow pure-Python
+ones on import. Running this is never required; the pure-Python module
+stays the source of truth and is what gets bundled into showFLOW.py.
+"""
+
+import os
+import subprocess
+import sys
+
+MODULES = [
+    "flow.py",
+    "rtcp4.py",
+    "rtcp5.py",
+]
+
+
+def build_extensions(folder="src"):
+    here = os.path.dirname(os.path.abspath(__file__))
+    paths = [os.path.join(here, module) for module in MODULES]
+    cmd = [sys.executable, "-m", "mypyc"] + paths
+    try:
+        proc = subprocess.run(cmd, cwd=here)
+    except FileNotFoundError:
+        print("mypyc not found, install mypy to build the extensions")
+        return 1
+    return proc.returncode
+
+
+if __name__ == "__main__":
+    sys.exit(build_extensions())
@@ -11,48 +11,107 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
 from dataclasses import dataclass
+from sys import intern as _intern
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 ################################ END IMPORTS ##################################
 ################################ BEGIN FLOW_PARSER ############################
 
 RE_FLOW = (
-    r".*?(?P<InIf>\d+) \[",
-    r".*?(?P<InSrcIP>[\d+.]*):",
-    r".*?(?P<InSrcPort>\d+) -> ",
-    r".*?(?P<InDstIP>[\d+.]*):",
-    r".*?(?P<InDstPort>\d+)\] .*?SSRC\[0\]",
-    r".*?(?P<SSRC>\w+)\{0\} .*sq\[0\]",
-    r".*?(?P<Seq>\w+) .*OUT ",
-    r".*?(?P<OutIf>\d+) RELAY ",
-    r".*?(?P<OutSrcIP>[\d+.]*):",
-    r".*?(?P<OutSrcPort>\d+) -> ",
-    r".*?(?P<OutDstIP>[\d+.]*):",
-    r".*?(?P<OutDstPort>\d+).*in VLAN ",
-    r".*?(?P<InVlan>\w+) out VLAN ",
-    r".*?(?P<OutVlan>\w+) Enc ",
-    r".*?(?P<Enc>\w+) Dec ",
-    r".*?(?P<Dec>\w+) Snt ",
-    r".*?(?P<Snt>\w+) Drp ",
-    r".*?(?P<Drp>\w+) Rx ",
-    r".*?(?P<Rx>\w+) Rly ",
-    r".*?(?P<Rly>\w+) ECH ",
-    r".*?(?P<Ech>\w+)",
+    r"(?P<InIf>\d+) \[",
+    r"(?P<InSrcIP>[\d+.]*):",
+    r"(?P<InSrcPort>\d+) -> ",
+    r"(?P<InDstIP>[\d+.]*):",
+    r"(?P<InDstPort>\d+)\] [^[]*SSRC\[0\] ",
+    r"(?P<SSRC>\w+)\{0\} [^a-z]*sq\[0\] ",
+    r"(?P<Seq>\w+) .*OUT ",
+    r"(?P<OutIf>\d+) RELAY ",
+    r"(?P<OutSrcIP>[\d+.]*):",
+    r"(?P<OutSrcPort>\d+) -> ",
+    r"(?P<OutDstIP>[\d+.]*):",
+    r"(?P<OutDstPort>\d+).*in VLAN ",
+    r"(?P<InVlan>\w+) out VLAN ",
+    r"(?P<OutVlan>\w+) Enc ",
+    r"(?P<Enc>\w+) Dec ",
+    r"(?P<Dec>\w+) Snt ",
+    r"(?P<Snt>\w+) Drp ",
+    r"(?P<Drp>\w+) Rx ",
+    r"(?P<Rx>\w+) Rly ",
+    r"(?P<Rly>\w+) ECH ",
+    r"(?P<Ech>\w+)",
 )
 
-reFLOW = re.compile("".join(RE_FLOW))
+reFLOW = _re_engine.compile(("^" + "".join(RE_FLOW)).encode(), re.ASCII | re.MULTILINE)
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
-def hex_to_dec(_str: str) -> int:
+_hsdb = None
+if hyperscan is not None:
     try:
-        return int(_str, 16)
-    except ValueError:
+        _hsdb = hyperscan.Database()
+        _hsdb.compile(
+            expressions=[re.sub(r"\(\?P<\w+>", "(", "^" + "".join(RE_FLOW)).encode()],
+            ids=[1],
+            flags=[hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SOM_LEFTMOST],
+        )
+    except hyperscan.error:
+        _hsdb = None
+
+
+def _iter_flow_matches(text):
+    """Yields reFLOW matches, letting the Hyperscan DFA locate candidate
+    lines first when the bindings are available so the backtracking
+    engine only runs group extraction on confirmed matches."""
+    if _hsdb is None:
+        yield from reFLOW.finditer(text)
+        return
+    starts = set()
+    _hsdb.scan(text,
+               match_event_handler=lambda _i, s, _e, _f, _c: starts.add(s))
+    for start in sorted(starts):
+        m = reFLOW.match(text, start)
+        if m:
+            yield m
+
+FLOW_GROUPS = (
+    'InIf', 'InSrcIP', 'InSrcPort', 'InDstIP', 'InDstPort', 'SSRC', 'Seq',
+    'OutIf', 'OutSrcIP', 'OutSrcPort', 'OutDstIP', 'OutDstPort',
+    'InVlan', 'OutVlan', 'Enc', 'Dec', 'Snt', 'Drp', 'Rx', 'Rly', 'Ech',
+)
+
+
+_HEX = {ord(c): i for i, c in enumerate("0123456789abcdef")}
+_HEX.update({ord(c): i for i, c in enumerate("0123456789ABCDEF")})
+
+_hex_cache: Dict[bytes, int] = {}
+
+
+def hex_to_dec(_str: bytes) -> int:
+    if _str == b"0":
         return 0
+    n = _hex_cache.get(_str)
+    if n is not None:
+        return n
+    n = 0
+    get = _HEX.get
+    for c in _str:
+        n = (n << 4) | get(c, 0)
+    if len(_hex_cache) < 4096:
+        _hex_cache[_str] = n
+    return n
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Flow:
     InIf: int
     InSrcIP: str
@@ -78,35 +137,33 @@ class Flow:
     timestamp: datetime
 
     @classmethod
-    def from_regex(cls, match_dict: Dict[str, str], timestamp: datetime) -> 'Flow':
-        """Create Flow from regex match dict with string values."""
+    def from_tuple(cls, groups: tuple, timestamp: datetime) -> 'Flow':
+        """Create Flow from the regex groups tuple, in RE_FLOW group order."""
+        _int = int
+        _hex = hex_to_dec
         return cls(
-            InIf=int(match_dict['InIf']),
-            InSrcIP=match_dict['InSrcIP'],
-            InSrcPort=int(match_dict['InSrcPort']),
-            InDstIP=match_dict['InDstIP'],
-            InDstPort=int(match_dict['InDstPort']),
-            SSRC=hex_to_dec(match_dict['SSRC']),
-            Seq=hex_to_dec(match_dict['Seq']),
-            OutIf=int(match_dict['OutIf']),
-            OutSrcIP=match_dict['OutSrcIP'],
-            OutSrcPort=int(match_dict['OutSrcPort']),
-            OutDstIP=match_dict['OutDstIP'],
-            OutDstPort=int(match_dict['OutDstPort']),
-            InVlan=int(match_dict['InVlan']),
-            OutVlan=int(match_dict['OutVlan']),
-            Enc=hex_to_dec(match_dict['Enc']),
-            Dec=hex_to_dec(match_dict['Dec']),
-            Snt=hex_to_dec(match_dict['Snt']),
-            Drp=hex_to_dec(match_dict['Drp']),
-            Rx=hex_to_dec(match_dict['Rx']),
-            Rly=hex_to_dec(match_dict['Rly']),
-            Ech=hex_to_dec(match_dict['Ech']),
-            timestamp=timestamp
+            _int(groups[0]), _intern(groups[1].decode()), _int(groups[2]),
+            _intern(groups[3].decode()), _int(groups[4]),
+            _hex(groups[5]), _hex(groups[6]),
+            _int(groups[7]), _intern(groups[8].decode()), _int(groups[9]),
+            _intern(groups[10].decode()), _int(groups[11]),
+            _int(groups[12]), _int(groups[13]),
+            _hex(groups[14]), _hex(groups[15]), _hex(groups[16]),
+            _hex(groups[17]), _hex(groups[18]), _hex(groups[19]),
+            _hex(groups[20]),
+            timestamp
+        )
+
+    @classmethod
+    def from_regex(cls, match_dict: Dict[str, bytes], timestamp: datetime) -> 'Flow':
+        """Create Flow from a regex match dict with bytes values, as
+        produced by matching reFLOW against the raw showflow line."""
+        return cls.from_tuple(
+            tuple(match_dict[name] for name in FLOW_GROUPS), timestamp
         )
 
     def is_rtcp(self) -> bool:
-        return self.InSrcPort % 2 == 1 and self.InDstPort % 2 == 1
+        return bool(self.InSrcPort & 1 and self.InDstPort & 1)
 
     @property
     def in_leg(self):
@@ -117,26 +174,102 @@ class Flow:
         return self.OutSrcIP, self.OutSrcPort, self.OutDstIP, self.OutDstPort
 
 
-def parse_showflow_310(output: str, timestamp: datetime, no_rtcp: bool = True) -> List[Flow]:
+def _flow_from_tokens(tokens: List[bytes], timestamp: datetime,
+                      no_rtcp: bool = True,
+                      rx_zero_only: bool = False) -> Optional['Flow']:
+    """Builds a Flow from a whitespace-split showflow line.
+
+    Fields are keyword-separated in the `showflow` output so plain list
+    indexing is enough, no regex backtracking needed. Raises IndexError
+    or ValueError on lines that do not follow the expected layout.
+    Returns None for flows excluded by the no_rtcp/rx_zero_only filters
+    without paying for a Flow construction.
+    """
+    if tokens[2] != b'->' or tokens[-2] != b'ECH':
+        raise ValueError(f"unexpected line layout: {tokens[:4]}")
+    InSrcIP, _, InSrcPort = tokens[1].lstrip(b'[').rpartition(b':')
+    InDstIP, _, InDstPort = tokens[3].rstrip(b']').rpartition(b':')
+    InSrcPort = int(InSrcPort)
+    InDstPort = int(InDstPort)
+    if no_rtcp and InSrcPort & 1 and InDstPort & 1:
+        return None
+    Rx = hex_to_dec(tokens[-5])
+    if rx_zero_only and Rx:
+        return None
+    s = tokens.index(b'SSRC[0]')
+    q = tokens.index(b'sq[0]')
+    o = tokens.index(b'OUT')
+    OutSrcIP, _, OutSrcPort = tokens[o + 3].rpartition(b':')
+    OutDstIP, _, OutDstPort = tokens[o + 5].rpartition(b':')
+    return Flow(
+        InIf=int(tokens[0]),
+        InSrcIP=_intern(InSrcIP.decode()),
+        InSrcPort=InSrcPort,
+        InDstIP=_intern(InDstIP.decode()),
+        InDstPort=InDstPort,
+        SSRC=hex_to_dec(tokens[s + 1].partition(b'{')[0]),
+        Seq=hex_to_dec(tokens[q + 1]),
+        OutIf=int(tokens[o + 1]),
+        OutSrcIP=_intern(OutSrcIP.decode()),
+        OutSrcPort=int(OutSrcPort),
+        OutDstIP=_intern(OutDstIP.decode()),
+        OutDstPort=int(OutDstPort),
+        InVlan=int(tokens[-18]),
+        OutVlan=int(tokens[-15]),
+        Enc=hex_to_dec(tokens[-13]),
+        Dec=hex_to_dec(tokens[-11]),
+        Snt=hex_to_dec(tokens[-9]),
+        Drp=hex_to_dec(tokens[-7]),
+        Rx=Rx,
+        Rly=hex_to_dec(tokens[-3]),
+        Ech=hex_to_dec(tokens[-1]),
+        timestamp=timestamp
+    )
+
+
+def parse_showflow_310(output: bytes, timestamp: datetime, no_rtcp: bool = True,
+                       rx_zero_only: bool = False) -> List[Flow]:
     """
     Parses the output of the `showflow 310 dynamic` command.
 
     Args:
-        output (str): The output string from the command.
+        output (bytes): The raw output of the command; str is
+            accepted and encoded for convenience.
         no_rtcp (bool): If True, RTCP flows will be excluded.
+        rx_zero_only (bool): If True, only flows with Rx == 0 are kept.
 
     Returns:
         List[Flow]: A list of Flow objects containing flow information.
     """
+    if isinstance(output, str):
+        output = output.encode()
     flows = []
+    failed = []
+    _from_tokens = _flow_from_tokens
+    flows_append = flows.append
+    failed_append = failed.append
     for line in output.splitlines():
-        m = reFLOW.match(line)
-        if m:
-            flow = Flow.from_regex(m.groupdict(), timestamp)
-            if not no_rtcp or not flow.is_rtcp():
-                flows.append(flow)
-        else:
-            logger.warning(f"Line did not match expected format: {line}")
+        if not line or not 48 <= line[0] <= 57:
+            continue
+        try:
+            flow = _from_tokens(line.split(), timestamp, no_rtcp, rx_zero_only)
+        except (IndexError, ValueError):
+            failed_append(line)
+            continue
+        if flow is not None:
+            flows_append(flow)
+    if failed:
+        matched = 0
+        for m in _iter_flow_matches(b"\n".join(failed)):
+            matched += 1
+            g = m.groups()
+            if no_rtcp and int(g[2]) & 1 and int(g[4]) & 1:
+                continue
+            if rx_zero_only and hex_to_dec(g[18]):
+                continue
+            flows.append(Flow.from_tuple(g, timestamp))
+        if matched < len(failed):
+            logger.warning("%d lines did not match expected format", len(failed) - matched)
     return flows
 
 ################################ END FLOW_PARSER ##############################
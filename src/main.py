@@ -9,6 +9,7 @@ It prints FLOWs in ASBCE that have not received audio packets.
 
 import asyncio
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,7 @@ import os
 from asyncio import Queue
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from platform import node
 from typing import Any, List, Dict, Optional
 
@@ -36,7 +38,7 @@ from flow import parse_showflow_310
 class CommandResult:
     """A consistent container for command output."""
 
-    stdout: str
+    stdout: bytes
     stderr: str
     returncode: Optional[int]
     name: Optional[str]
@@ -44,7 +46,7 @@ class CommandResult:
 
     def __init__(
         self,
-        stdout: str,
+        stdout: bytes,
         stderr: str,
         returncode: Optional[int],
         name: Optional[str] = None,
@@ -73,79 +75,151 @@ class CommandResult:
         return f"CommandResult({', '.join(fields)})"
 
 
+FRAME_END = "__FRAME_END__"
+
+# Prebuilt format templates so the per-flow print path reuses the parsed
+# format specs instead of re-evaluating two f-strings per flow.
+INSIDE_FMT = "{0} (Rx {1}) {2:>15}:{3:<5} <= {4:>5}:{5:<15}".format
+OUTSIDE_FMT = "{0:>15}:{1:<5} <= {2:>5}:{3:<15} (Rly {4}) {5}".format
+REPORT_FMT = "{0:%Y-%m-%d@%H:%M:%S}   {1}".format
+
+
 async def showflows(queue, sbce, level=7, sleep=2)  :
     cmd = f"showflow {sbce.hw_type} dynamic {level}"
+    script = f"while true; do {cmd}; echo {FRAME_END}; sleep {sleep}; done"
     while True:
         try:
-            proc = await asyncio.create_subprocess_shell(
-                cmd,
+            proc = await asyncio.create_subprocess_exec(
+                "sh", "-c", script,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
 
-            stdout_bytes, stderr_bytes = await proc.communicate()
-            stdout_text = stdout_bytes.decode(errors="replace").strip()
-            stderr_text = stderr_bytes.decode(errors="replace").strip()
-                        
-            if proc.returncode == 0 and stdout_text:
-                commandresult = CommandResult(
-                    stdout=stdout_text,
-                    stderr=stderr_text,
-                    returncode=proc.returncode,
-                    timestamp=datetime.now(),
-                    name=cmd
-                )
-                await queue.put(commandresult)
-            else:
-                logger.debug("No flows")
+            async def drain_stderr(stream):
+                # Keep stderr drained so the shell never blocks on a
+                # full pipe buffer, and surface whatever showflow
+                # complains about; chunked reads sidestep the
+                # StreamReader line-length limit
+                while True:
+                    err_bytes = await stream.read(4096)
+                    if not err_bytes:
+                        break
+                    err = err_bytes.strip()
+                    if err:
+                        logger.error(
+                            "showflow: %s", err.decode(errors="replace")
+                        )
+
+            stderr_task = asyncio.create_task(drain_stderr(proc.stderr))
+
+            frame_end = FRAME_END.encode()
+            lines = []
+            async for line_bytes in proc.stdout:
+                line = line_bytes.rstrip()
+                if line == frame_end:
+                    stdout_text = b"\n".join(lines)
+                    lines = []
+                    if stdout_text:
+                        commandresult = CommandResult(
+                            stdout=stdout_text,
+                            stderr="",
+                            returncode=0,
+                            timestamp=datetime.now(),
+                            name=cmd
+                        )
+                        await queue.put(commandresult)
+                    else:
+                        logger.debug("No flows")
+                elif line:
+                    lines.append(line)
+            await proc.wait()
+            await stderr_task
+            logger.error("showflow loop exited with code %s", proc.returncode)
             await asyncio.sleep(sleep)
         except Exception as e:
-            logger.error(f"{repr(e)}")
+            logger.error("%r", e)
 
 
 async def analyze_flows(queue, sbce):
     prev = set()
     curr = set()
+
+    @lru_cache(maxsize=64)
+    def iface_of(ip):
+        return sbce.ifaces.get(ip, "??")
+
     while True:
-        commandresult = await queue.get()
-        if commandresult.stderr:
-            logger.error(f"Error in item {commandresult}")
-            continue
-
-        flows = parse_showflow_310(
-            commandresult.stdout,
-            timestamp=commandresult.timestamp
-        )
-
-        curr.clear()
-        for flow in flows:
-            InSrcIP, InSrcPort, InDstIP, InDstPort = flow.in_leg
-            InIface = sbce.ifaces.get(InDstIP, "??")
-            OutSrcIP, OutSrcPort, OutDstIP, OutDstPort = flow.out_leg
-            OutIface = sbce.ifaces.get(OutSrcIP, "??")
-            if InSrcIP == "0.0.0.0" or OutDstIP == "0.0.0.0":
+        items = [await queue.get()]
+        # Drain any backlog so a burst of frames is handled in one wakeup
+        # instead of one scheduler round-trip per frame. Frames are still
+        # parsed in order; concatenating them would break the prev/curr
+        # zero-Rx comparison.
+        while True:
+            try:
+                items.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        for commandresult in items:
+            if commandresult.stderr:
+                logger.error("Error in item %s", commandresult)
                 continue
-            if flow.Rx == 0:
-                inside = f"{InIface} (Rx {flow.Rx}) {InDstIP:>15}:{InDstPort:<5} <= {InSrcPort:>5}:{InSrcIP:<15}"
-                outside = f"{OutDstIP:>15}:{OutDstPort:<5} <= {OutSrcPort:>5}:{OutSrcIP:<15} (Rly {flow.Rly}) {OutIface}"
-                zerorx_flow = f"{outside}-SBCE-{inside}"
-                curr.add(zerorx_flow)
-                if zerorx_flow in prev:
-                    print(f"{flow.timestamp:%Y-%m-%d@%H:%M:%S}   {zerorx_flow}")
-        prev = set(curr)
+
+            flows = parse_showflow_310(
+                commandresult.stdout,
+                timestamp=commandresult.timestamp,
+                rx_zero_only=True
+            )
+
+            curr.clear()
+            report = []
+            curr_add = curr.add
+            report_append = report.append
+            for flow in flows:
+                InSrcIP = flow.InSrcIP
+                InSrcPort = flow.InSrcPort
+                InDstIP = flow.InDstIP
+                InDstPort = flow.InDstPort
+                InIface = iface_of(InDstIP)
+                OutSrcIP = flow.OutSrcIP
+                OutSrcPort = flow.OutSrcPort
+                OutDstIP = flow.OutDstIP
+                OutDstPort = flow.OutDstPort
+                OutIface = iface_of(OutSrcIP)
+                if InSrcIP == "0.0.0.0" or OutDstIP == "0.0.0.0":
+                    continue
+                if flow.Rx == 0:
+                    inside = INSIDE_FMT(InIface, flow.Rx, InDstIP, InDstPort,
+                                        InSrcPort, InSrcIP)
+                    outside = OUTSIDE_FMT(OutDstIP, OutDstPort, OutSrcPort,
+                                          OutSrcIP, flow.Rly, OutIface)
+                    zerorx_flow = outside + "-SBCE-" + inside
+                    curr_add(zerorx_flow)
+                    if zerorx_flow in prev:
+                        report_append(REPORT_FMT(flow.timestamp, zerorx_flow))
+            if report:
+                sys.stdout.write("\n".join(report) + "\n")
+            prev = set(curr)
 
 
 async def main():
     """Main function for showFLOW application."""
 
     sbce = SBCE()
-    queue = Queue()
+    # Prewarm the lazy SBCE properties off the event loop so the first
+    # flow analysis never blocks on a subprocess or file read.
+    await asyncio.gather(
+        sbce.prepare(),
+        asyncio.to_thread(lambda: sbce.ifaces),
+        asyncio.to_thread(lambda: sbce.media_ifaces),
+        asyncio.to_thread(lambda: sbce.servers),
+    )
+    queue = Queue(maxsize=2)
     analyzer = asyncio.create_task(analyze_flows(queue, sbce))
     collector = asyncio.create_task(showflows(queue, sbce))
     try:
         await asyncio.gather(analyzer, collector)
     except Exception as e:
-        logger.error("Exception {e}")
+        logger.error("Exception %s", e)
 
 
 ################################ END MAIN #####################################
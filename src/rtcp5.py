@@ -2,10 +2,30 @@
 import asyncio
 import argparse
 import json
+import socket
+import struct
 import sys
 from dataclasses import dataclass
 from typing import Optional, List
 
+# Precompiled layouts for the fixed parts of the subtype 5 payload: the
+# 13-byte prefix before the variable hop block and the RTT/port trailer.
+# Performance note: this decode path is interpreter-overhead-bound, not
+# compute-bound — the payload is 46 bytes, far below anything SIMD or
+# offload could help with. Optimize by removing Python-level work
+# (precompiled Structs, bytes in, lazy field formatting); see
+# tools/bench_rtcp.py for the parse/JSON throughput harness.
+_COLON_DROP = str.maketrans('', '', ':')
+# tshark header fields copied verbatim into the packet, fetched in one pass
+_HDR_KEYS = (
+    'rtcp_rtcp_version', 'rtcp_rtcp_padding', 'rtcp_rtcp_app_subtype',
+    'rtcp_rtcp_pt', 'rtcp_rtcp_length', 'rtcp_rtcp_ssrc_identifier',
+    'rtcp_rtcp_app_name',
+)
+_SUB5_PREFIX = struct.Struct('>IIIB')
+_SUB5_HOP = struct.Struct('>4s')
+_SUB5_TAIL = struct.Struct('>HHH')
+
 """
 Avaya Sub-type 5 RTCP packet layout
 +----------------+---------------+---------------+---------------+
@@ -28,7 +48,30 @@ Avaya Sub-type 5 RTCP packet layout
 |  Outgoing Stream RTP Dest Port |NullTermination|NullTermination|byte -4:None
 +----------------+---------------+---------------+---------------+
 """
-@dataclass
+_SUB5_TEMPLATE = """
+Avaya Subtype 5 RTCP Packet:
+  Header:
+    Version: {}
+    Padding: {}
+    Subtype: {}
+    Packet Type: {}
+    Length: {}
+    SSRC: {}
+    Name: {}
+  
+  Payload:
+    Incoming RTP SSRC: {}
+    Metric Mask: {}
+    Comm Controller IP: {}
+    Traceroute Hop Count: {}
+    {}
+    RTT to Last Hop: {} ms
+    Outgoing RTP Source Port: {}
+    Outgoing RTP Dest Port: {}
+"""
+
+
+@dataclass(slots=True, frozen=True)
 class AvayaSubtype5Packet:
     """
     Avaya Sub-type 5 RTCP packet layout (bytes 13+)
@@ -59,16 +102,29 @@ class AvayaSubtype5Packet:
     ssrc: str
     name: str
     
-    # Parsed data fields (from rtcp.app.data)
-    incoming_rtp_ssrc: str
-    metric_mask: str
-    comm_controller_ip: str
+    # Parsed data fields (from rtcp.app.data); SSRC, metric mask and the
+    # controller IP are kept as raw unsigned ints and formatted on demand
+    incoming_rtp_ssrc_u32: int
+    metric_mask_u32: int
+    comm_controller_ip_u32: int
     traceroute_hop_count: int
     traceroute_hops: List[str]
     rtt_last_hop: int
     outgoing_rtp_src_port: int
     outgoing_rtp_dst_port: int
-    
+
+    @property
+    def incoming_rtp_ssrc(self) -> str:
+        return f'0x{self.incoming_rtp_ssrc_u32:08x}'
+
+    @property
+    def metric_mask(self) -> str:
+        return f'0x{self.metric_mask_u32:08x}'
+
+    @property
+    def comm_controller_ip(self) -> str:
+        return socket.inet_ntoa(self.comm_controller_ip_u32.to_bytes(4, 'big'))
+
     @classmethod
     def parse(cls, rtcp_data: dict) -> Optional['AvayaSubtype5Packet']:
         """Parse RTCP data into AvayaSubtype5Packet."""
@@ -77,107 +133,95 @@ class AvayaSubtype5Packet:
             if rtcp_data.get('rtcp_rtcp_app_subtype') != '5':
                 return None
             
-            # Get the app data (hex string with colons)
-            app_data_hex = rtcp_data.get('rtcp_rtcp_app_data', '')
-            if not app_data_hex:
-                return None
-            
+            # Get the app data (hex string with colons); a missing field
+            # lands in the KeyError handler below like any malformed packet
+            app_data_hex = rtcp_data['rtcp_rtcp_app_data']
+
             # Convert hex string to bytes
-            data_bytes = bytes.fromhex(app_data_hex.replace(':', ''))
+            data_bytes = bytes.fromhex(app_data_hex.translate(_COLON_DROP))
             
             # Parse the data (starting from byte 13 of the full packet)
-            # Bytes 0-3: SSRC of incoming RTP stream
-            incoming_rtp_ssrc = '0x' + data_bytes[0:4].hex()
-            
-            # Bytes 4-7: Metric Mask
-            metric_mask = '0x' + data_bytes[4:8].hex()
-            
-            # Bytes 8-11: IPv4 address of Communications Controller
-            comm_controller_ip = f"{data_bytes[8]}.{data_bytes[9]}.{data_bytes[10]}.{data_bytes[11]}"
-            
-            # Byte 12: Traceroute hop count
-            traceroute_hop_count = data_bytes[12]
-            
-            # Parse traceroute hops (variable number based on hop count)
-            # Each hop is 4 bytes for IPv4 address
-            traceroute_hops = []
-            hop_start = 13
-            for i in range(traceroute_hop_count):
-                hop_end = hop_start + 4
-                if hop_end <= len(data_bytes):
-                    hop_ip = f"{data_bytes[hop_start]}.{data_bytes[hop_start+1]}.{data_bytes[hop_start+2]}.{data_bytes[hop_start+3]}"
-                    traceroute_hops.append(hop_ip)
-                    hop_start = hop_end
-                else:
-                    break
-            
+            # Bytes 0-3: SSRC, bytes 4-7: Metric Mask, bytes 8-11: IPv4 of
+            # the Communications Controller, byte 12: traceroute hop count
+            (
+                incoming_rtp_ssrc_u32,
+                metric_mask_u32,
+                comm_controller_ip_u32,
+                traceroute_hop_count
+            ) = _SUB5_PREFIX.unpack_from(data_bytes)
+
+            # Parse traceroute hops (variable number based on hop count,
+            # bounds-checked once against the payload). iter_unpack walks
+            # the zero-copy memoryview in C, inet_ntoa formats in C.
+            n_hops = min(traceroute_hop_count, (len(data_bytes) - 13) // 4)
+            hops_view = memoryview(data_bytes)[13:13 + 4 * n_hops]
+            traceroute_hops = [
+                socket.inet_ntoa(raw)
+                for (raw,) in _SUB5_HOP.iter_unpack(hops_view)
+            ]
+
             # Fixed fields at the end (working backwards from the end)
             # RTCP packets are padded to 32-bit boundaries
             # When length is odd, there are 2 null terminator bytes
             # When length is even, there is 1 null terminator byte
-            rtcp_length = int(rtcp_data.get('rtcp.length', '0'))
-            null_bytes = 2 if rtcp_length % 2 == 1 else 1
-            
-            # Outgoing stream RTP destination port (2 bytes before null terminators)
-            dst_port_end = -null_bytes
-            dst_port_start = dst_port_end - 2
-            outgoing_rtp_dst_port = int.from_bytes(data_bytes[dst_port_start:dst_port_end], byteorder='big')
-            
-            # Outgoing stream RTP source port (2 bytes before dest port)
-            src_port_end = dst_port_start
-            src_port_start = src_port_end - 2
-            outgoing_rtp_src_port = int.from_bytes(data_bytes[src_port_start:src_port_end], byteorder='big')
-            
-            # RTT to last hop (2 bytes before source port)
-            rtt_end = src_port_start
-            rtt_start = rtt_end - 2
-            rtt_last_hop = int.from_bytes(data_bytes[rtt_start:rtt_end], byteorder='big')
-            
+            # Accepts the field as int when the JSON layer already coerced
+            # it (orjson path), converting only legacy string values
+            rtcp_length = rtcp_data.get('rtcp.length', 0)
+            if not isinstance(rtcp_length, int):
+                rtcp_length = int(rtcp_length or 0)
+
+            # RTT to last hop, outgoing source port, outgoing dest port: the
+            # 6 bytes just before the null terminators (2 on odd length,
+            # 1 on even), in one unpack at an absolute offset
+            tail = len(data_bytes) - 7 - (rtcp_length & 1)
+            rtt_last_hop, outgoing_rtp_src_port, outgoing_rtp_dst_port = \
+                _SUB5_TAIL.unpack_from(data_bytes, tail)
+
+            get = rtcp_data.get
+            version, padding, subtype, packet_type, length, ssrc, name = \
+                [get(k, '') for k in _HDR_KEYS]
+
             return cls(
-                version=rtcp_data.get('rtcp_rtcp_version', ''),
-                padding=rtcp_data.get('rtcp_rtcp_padding', ''),
-                subtype=rtcp_data.get('rtcp_rtcp_app_subtype', ''),
-                packet_type=rtcp_data.get('rtcp_rtcp_pt', ''),
-                length=rtcp_data.get('rtcp_rtcp_length', ''),
-                ssrc=rtcp_data.get('rtcp_rtcp_ssrc_identifier', ''),
-                name=rtcp_data.get('rtcp_rtcp_app_name', ''),
-                incoming_rtp_ssrc=incoming_rtp_ssrc,
-                metric_mask=metric_mask,
-                comm_controller_ip=comm_controller_ip,
+                version=version,
+                padding=padding,
+                subtype=subtype,
+                packet_type=packet_type,
+                length=length,
+                ssrc=ssrc,
+                name=name,
+                incoming_rtp_ssrc_u32=incoming_rtp_ssrc_u32,
+                metric_mask_u32=metric_mask_u32,
+                comm_controller_ip_u32=comm_controller_ip_u32,
                 traceroute_hop_count=traceroute_hop_count,
                 traceroute_hops=traceroute_hops,
                 rtt_last_hop=rtt_last_hop,
                 outgoing_rtp_src_port=outgoing_rtp_src_port,
                 outgoing_rtp_dst_port=outgoing_rtp_dst_port
             )
-        except (IndexError, ValueError, KeyError) as e:
+        except (IndexError, ValueError, KeyError, struct.error) as e:
             print(f"[Error parsing Avaya subtype 5 packet]: {e}", file=sys.stderr)
             return None
     
     def __str__(self):
         """Pretty print the packet."""
         hops_str = '\n    '.join([f"Hop {i+1}: {hop}" for i, hop in enumerate(self.traceroute_hops)])
-        return f"""
-Avaya Subtype 5 RTCP Packet:
-  Header:
-    Version: {self.version}
-    Padding: {self.padding}
-    Subtype: {self.subtype}
-    Packet Type: {self.packet_type}
-    Length: {self.length}
-    SSRC: {self.ssrc}
-    Name: {self.name}
-  
-  Payload:
-    Incoming RTP SSRC: {self.incoming_rtp_ssrc}
-    Metric Mask: {self.metric_mask}
-    Comm Controller IP: {self.comm_controller_ip}
-    Traceroute Hop Count: {self.traceroute_hop_count}
-    {hops_str if hops_str else 'No traceroute hops'}
-    RTT to Last Hop: {self.rtt_last_hop} ms
-    Outgoing RTP Source Port: {self.outgoing_rtp_src_port}
-    Outgoing RTP Dest Port: {self.outgoing_rtp_dst_port}
-"""
+        return _SUB5_TEMPLATE.format(
+            self.version,
+            self.padding,
+            self.subtype,
+            self.packet_type,
+            self.length,
+            self.ssrc,
+            self.name,
+            self.incoming_rtp_ssrc,
+            self.metric_mask,
+            self.comm_controller_ip,
+            self.traceroute_hop_count,
+            hops_str if hops_str else 'No traceroute hops',
+            self.rtt_last_hop,
+            self.outgoing_rtp_src_port,
+            self.outgoing_rtp_dst_port
+        )
 
 if __name__ == "__main__":
     rtcp5_data1 = {
@@ -8,56 +8,121 @@ import json
 import sys
 from typing import Callable
 
+try:
+    from orjson import loads as _jloads
+except ImportError:
+    from json import loads as _jloads
+
 ################################ END IMPORTS #################################
 
+# Performance note: the tshark -> JSON -> parse pipeline is bound by
+# per-line interpreter overhead, not numeric compute; keep optimizations
+# at that level (batched bytes reads, orjson, dispatch table). See
+# tools/bench_rtcp.py for the throughput harness.
+
 import logging
 logger = logging.getLogger(__name__)
 
+from rtcp4 import AvayaSubtype4Packet
+from rtcp5 import AvayaSubtype5Packet
+
+_PARSERS = {
+    '4': AvayaSubtype4Packet.parse,
+    '5': AvayaSubtype5Packet.parse,
+}
+
+
+def dispatch(rtcp_data: dict):
+    """Route an EK packet dict to the matching subtype parser.
+
+    One dict lookup instead of trying each parser in turn (every
+    attempted parse would redo the hex decode). Returns None for
+    subtypes nobody handles. Both tshark field spellings are accepted
+    since the subtype parsers differ on that historically.
+    """
+    subtype = (rtcp_data.get('rtcp.app.subtype')
+               or rtcp_data.get('rtcp_rtcp_app_subtype'))
+    parser = _PARSERS.get(subtype)
+    return parser(rtcp_data) if parser else None
+
+
 class RTCPMonitor:
     """Monitor tshark output and parse packets asynchronously."""
     
-    def __init__(self, on_packet_callback: Callable, interface: str = 'any', port: int = 5005):
+    def __init__(self, on_packet_callback: Callable, interface: str = 'any',
+                 port: int = 5005, debug: bool = False, fields: list = None,
+                 display_filter: str = None):
         """
         Initialize TShark monitor.
-        
+
         Args:
             on_packet_callback: Callback function to call with parsed packet data
             interface: Network interface to monitor (default: 'any')
             port: UDP port to monitor (default: 5005)
+            debug: Forward tshark stderr instead of discarding it (default: False)
+            fields: Optional tshark field names (e.g. ['rtcp.app.subtype',
+                'rtcp.app.data']) passed as `-e` so tshark emits only those
+                instead of the full dissection, cutting the JSON volume per
+                packet. Note: with `-e` tshark wraps each value in a list,
+                so the callback must unwrap accordingly.
+            display_filter: Optional tshark display filter passed as `-Y`
+                (e.g. 'rtcp.app.subtype == 4 or rtcp.app.subtype == 5') so
+                packets nobody parses are dropped inside tshark and never
+                cross the pipe.
         """
         self.on_packet_callback = on_packet_callback
         self.interface = interface
         self.port = port
+        self.debug = debug
+        self.fields = fields
+        self.display_filter = display_filter
         self.process = None
     
     async def _read_stream(self, stream, callback):
-        """Read from a stream line by line and call callback for each line."""
+        """Read from a stream in large chunks and call callback per line.
+
+        Lines are passed as raw bytes; decoding is left to the handlers
+        that actually need text so the hot stdout path never decodes.
+        Reading 64 KiB at a time and splitting on newlines here batches
+        kernel reads instead of one readline wakeup per packet.
+        """
+        buf = bytearray()
         while True:
-            line = await stream.readline()
-            if not line:
+            chunk = await stream.read(65536)
+            if not chunk:
                 break
-            callback(line.decode('utf-8'))
-    
-    def _handle_stdout(self, line: str):
+            buf += chunk
+            start = 0
+            while True:
+                nl = buf.find(b'\n', start)
+                if nl < 0:
+                    break
+                callback(bytes(buf[start:nl + 1]))
+                start = nl + 1
+            if start:
+                del buf[:start]
+        if buf:
+            callback(bytes(buf))
+
+    def _handle_stdout(self, line: bytes):
         """Handle each line from tshark stdout."""
         # Only process lines that start with '{"timestamp"' - these are packet lines
-        if line.startswith('{"timestamp"'):
+        if line.startswith(b'{"timestamp"'):
             self._parse_and_callback(line)
-    
-    def _parse_and_callback(self, line: str):
+
+    def _parse_and_callback(self, line: bytes):
         """Parse JSON line and call the callback."""
         try:
-            json_str = line.strip()
-            data = json.loads(json_str)
+            data = _jloads(line)
             self.on_packet_callback(data)
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             print(f"[JSON Parse Error]: {e}", file=sys.stderr)
-            print(f"[Line content]: {line}", file=sys.stderr)
-    
-    def _handle_stderr(self, line: str):
+            print(f"[Line content]: {line!r}", file=sys.stderr)
+
+    def _handle_stderr(self, line: bytes):
         """Handle each line from tshark stderr."""
         if line.strip():
-            print(f"[tshark stderr]: {line.rstrip()}", file=sys.stderr)
+            print(f"[tshark stderr]: {line.decode(errors='replace').rstrip()}", file=sys.stderr)
     
     async def start(self):
         """Start monitoring tshark output."""
@@ -70,23 +135,31 @@ class RTCPMonitor:
             '-T', 'ek',                 # format of text output to Elasticsearch
             '-f', f'udp port {self.port}'  # packet filter
         ]
-        
+        if self.fields:
+            for field in self.fields:
+                cmd += ['-e', field]
+        if self.display_filter:
+            cmd += ['-Y', self.display_filter]
+
         print(f"Starting tshark with command: {' '.join(cmd)}")
         print(f"Monitoring traffic on interface {self.interface}, port {self.port}")
         print("-" * 80)
         
-        # Start tshark process
+        # Start tshark process; in steady state stderr goes to /dev/null so
+        # the loop is not woken for a stream that is normally silent
         self.process = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        
-        # Create tasks to read stdout and stderr concurrently
-        await asyncio.gather(
-            self._read_stream(self.process.stdout, self._handle_stdout),
-            self._read_stream(self.process.stderr, self._handle_stderr)
+            stderr=asyncio.subprocess.PIPE if self.debug
+                else asyncio.subprocess.DEVNULL
         )
+
+        # Create tasks to read stdout (and stderr in debug mode) concurrently
+        readers = [self._read_stream(self.process.stdout, self._handle_stdout)]
+        if self.debug:
+            readers.append(
+                self._read_stream(self.process.stderr, self._handle_stderr))
+        await asyncio.gather(*readers)
         
         # Wait for process to complete
         await self.process.wait()
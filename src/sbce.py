@@ -9,10 +9,17 @@ This module contains the SBCE object
 import json
 import logging
 
+try:
+    from orjson import loads as _jloads
+except ImportError:
+    from json import loads as _jloads
+
 logger = logging.getLogger(__name__)
 
+import asyncio
 import os
 import re
+import subprocess
 import netifaces as ni
 from dataclasses import dataclass
 from platform import node
@@ -20,7 +27,34 @@ from platform import node
 ################################ END IMPORTS ##################################
 ################################ BEGIN SBCE ###################################
 
-@dataclass
+_RE_EMS = re.compile(r"--ems-node-ip=(?P<ems_ip>\d+(?:\.\d+){3})")
+
+
+def _ssyndi_cmdline():
+    """str: Returns the command line of the ssyndi process.
+
+    Scans /proc directly, which avoids forking a shell and ps; falls
+    back to ps when /proc is not readable.
+    """
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/comm") as handle:
+                if handle.read().strip() != "ssyndi":
+                    continue
+            with open(f"/proc/{pid}/cmdline", "rb") as handle:
+                return handle.read().replace(b"\0", b" ").decode()
+        except OSError:
+            continue
+
+    proc = subprocess.run(
+        ["ps", "--columns", "999", "-f", "-C", "ssyndi"],
+        capture_output=True, text=True
+    )
+    return proc.stdout
+
+@dataclass(slots=True, frozen=True)
 class Server(object):
     """SBCE Server object"""
     server_config_name: str
@@ -28,7 +62,7 @@ class Server(object):
     server_address: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MediaInterface(object):
     """SBCE Media Interface object"""
     media_name: str
@@ -52,6 +86,7 @@ class SBCE(object):
         self._media_ifaces = None
         self._servers = None
         self._sysinfo = None
+        self._sysinfo_dict = None
         self._version = None
         self._hostname = None
         self._hw_type = None
@@ -62,8 +97,7 @@ class SBCE(object):
         if self._ems_ip is not None:
             return self._ems_ip
 
-        output = os.popen("ps --columns 999 -f -C ssyndi").read()
-        m = re.search(r"--ems-node-ip=(?P<ems_ip>\d+(?:\.\d+){3})", output)
+        m = _RE_EMS.search(_ssyndi_cmdline())
 
         ems_ip = m["ems_ip"] if m else ""
         self._ems_ip = ems_ip
@@ -75,8 +109,8 @@ class SBCE(object):
         if self._hw_type is not None:
             return self._hw_type
 
-        m = re.search(r"HARDWARE=(.*)\n", self.sysinfo)
-        hw_type = int(m.group(1)) if m and m.group(1).isdigit() else None
+        value = self._sysinfo_field("HARDWARE")
+        hw_type = int(value) if value.isdigit() else None
         self._hw_type = hw_type
 
         return hw_type
@@ -89,9 +123,25 @@ class SBCE(object):
         if self._ifaces is not None:
             return self._ifaces
 
+        try:
+            proc = subprocess.run(
+                ["ip", "-j", "addr"], capture_output=True, text=True
+            )
+            if proc.returncode == 0:
+                ifaces = {
+                    addr["local"]: link["ifname"]
+                    for link in _jloads(proc.stdout)
+                    for addr in link.get("addr_info", [])
+                    if "local" in addr
+                }
+                self._ifaces = ifaces
+                return ifaces
+        except (OSError, ValueError):
+            pass
+
         ifaces = {
-            ifaddr["addr"]: iface 
-            for iface in ni.interfaces() 
+            ifaddr["addr"]: iface
+            for iface in ni.interfaces()
             for family in [ni.AF_INET, ni.AF_INET6]
             for ifaddr in ni.ifaddresses(iface).get(family, [])
         }
@@ -110,7 +160,7 @@ class SBCE(object):
 
         if json_res:
             try:
-                media_data = json.loads(json_res)
+                media_data = _jloads(json_res)
                 media_ifaces = [
                     MediaInterface(
                         media_name=entry.get("media_name", ""),
@@ -122,8 +172,8 @@ class SBCE(object):
                 ]
                 self._media_ifaces = media_ifaces
                 return media_ifaces
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON result: {json_res} - {e}")
+            except ValueError as e:
+                logger.error("Failed to parse JSON result: %s - %s", json_res, e)
                 self._media_ifaces = []
         return []
 
@@ -137,15 +187,38 @@ class SBCE(object):
             self._sysinfo = handle.read()
         return self._sysinfo
 
+    def _sysinfo_field(self, key):
+        """str: Returns one key=value field of the sysinfo file.
+
+        The file is parsed into a dict on first use so the properties
+        derived from it each cost a dict lookup instead of their own
+        regex pass over the whole file.
+        """
+        if self._sysinfo_dict is None:
+            try:
+                text = self.sysinfo
+            except OSError:
+                # Missing or unreadable sysinfo: cache the empty result
+                # so later property accesses do not retry the open
+                self._sysinfo = ""
+                text = ""
+            self._sysinfo_dict = {
+                k.strip(): v.strip()
+                for k, sep, v in (
+                    line.partition("=") for line in text.splitlines()
+                )
+                if sep
+            }
+        return self._sysinfo_dict.get(key, "")
+
     @property
     def version(self):
         """str: Returns the software version of the SBCE in short format."""
         if self._version is not None:
             return self._version
 
-        m = re.search("VERSION=(.*)\n", self.sysinfo)
-        version = m.group(1) if m else ""
-        self._version = version 
+        version = self._sysinfo_field("VERSION")
+        self._version = version
         return version
 
     @property
@@ -159,8 +232,7 @@ class SBCE(object):
             self._hostname = hostname
             return hostname
 
-        m = re.search(r"ApplianceName=(.*)\n", self.sysinfo)
-        hostname = m.group(1) if m else ""
+        hostname = self._sysinfo_field("ApplianceName")
         self._hostname = hostname
         return hostname
 
@@ -177,7 +249,7 @@ class SBCE(object):
 
         if json_res:
             try:
-                servers_data = json.loads(json_res)
+                servers_data = _jloads(json_res)
                 servers = [
                     Server(
                         server_config_name=entry.get("server_config_name", ""),
@@ -188,21 +260,32 @@ class SBCE(object):
                 ]
                 self._servers = servers
                 return servers
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON result: {json_res} - {e}")
+            except ValueError as e:
+                logger.error("Failed to parse JSON result: %s - %s", json_res, e)
                 self._servers = []
         return []
 
+
+    async def prepare(self):
+        """Caches sysinfo and the properties derived from it off the
+        event loop so later accesses are plain attribute reads."""
+        def _warm():
+            _ = self.sysinfo
+            _ = self.version
+            _ = self.hw_type
+            _ = self.hostname
+        await asyncio.to_thread(_warm)
+
     def _exec_sql(self, sql):
         fmt = f"SELECT json_agg(row_to_json(t)) FROM ({sql}) AS t;"
-        psql_cmd = f'psql -t -U postgres sbcedb -c "{fmt}"'
+        psql_cmd = ["psql", "-t", "-U", "postgres", "sbcedb", "-c", fmt]
         try:
-            command = os.popen(psql_cmd)
-            output = command.read().strip()
-            exit_status = command.close()
-            return output if exit_status is None else ""
+            proc = subprocess.run(
+                psql_cmd, capture_output=True, text=True, timeout=10
+            )
+            return proc.stdout.strip() if proc.returncode == 0 else ""
         except Exception as e:
-            logger.error(f"Failed to execute SQL command: {psql_cmd} - {e}")
+            logger.error("Failed to execute SQL command: %s - %s", psql_cmd, e)
             return ""
 
 ################################# END SBCE ####################################
@@ -10,15 +10,15 @@
 ## Source: https://github.com/sszokoly/traceroute
 ##############################################################################
 
+import functools
 import os
 import time
-import select
+import selectors
 import socket
 import struct
 import fcntl
 import array
 import platform
-from contextlib import ExitStack
 
 try:
     import netifaces
@@ -26,7 +26,11 @@ try:
     get_interface_names = netifaces.interfaces
 except ModuleNotFoundError:
 
-    def get_interface_names():
+    _IFNAMES_TTL = 5.0
+    _ifnames_cache = None
+    _ifnames_cached_at = 0.0
+
+    def _scan_interface_names():
         max_interfaces = 128
         bytes_size = max_interfaces * 40  # Increased size for 64-bit
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -52,7 +56,18 @@ except ModuleNotFoundError:
                 interfaces.append(name)
             i += 40  # Size of ifreq structure on 64-bit systems
 
-        return [x for x in set(interfaces) if x]
+        # Dedupe while preserving discovery order
+        return list(dict.fromkeys(interfaces))
+
+    def get_interface_names():
+        # Interfaces rarely change mid-trace; cache the scan briefly so
+        # the per-probe socket factories skip the socket+ioctl round-trip
+        global _ifnames_cache, _ifnames_cached_at
+        now = time.monotonic()
+        if _ifnames_cache is None or now - _ifnames_cached_at > _IFNAMES_TTL:
+            _ifnames_cache = _scan_interface_names()
+            _ifnames_cached_at = now
+        return _ifnames_cache
 
 
 try:
@@ -79,25 +94,28 @@ DEFAULT_COUNT_BYTE = 1024
 
 
 class HopResult:
+    __slots__ = (
+        "nqueries", "count_of_success", "sum_response_time",
+        "response_times", "hosts",
+    )
+
     def __init__(self, nqueries: int = 3):
         self.nqueries = nqueries
         self.count_of_success = 0
-        self.response_times = []
-        for _ in range(nqueries):
-            self.response_times.append(0.0)
+        self.sum_response_time = 0.0
+        self.response_times = [0.0] * nqueries
         self.hosts = []
 
     def add(self, query_num: int, value):
         self.response_times[query_num] = value
+        if value is not None:
+            self.sum_response_time += value
         self.count_of_success += 1
 
     def avg_response_time(self):
-        sum_all = 0
-        for value in self.response_times:
-            sum_all += value
         if not self.count_of_success:
             return 0.0
-        return sum_all / self.count_of_success
+        return self.sum_response_time / self.count_of_success
 
 
 def create_icmp_packet(packet_id, sequence, packetlen=40):
@@ -134,6 +152,17 @@ def calculate_checksum(data):
     return ~s & 0xFFFF
 
 
+@functools.lru_cache(maxsize=4096)
+def _resolve(ip):
+    """Reverse-resolve an address, memoized; the same routers answer for
+    many hops and across consecutive traces, so each PTR lookup (often
+    50-500 ms) is paid once."""
+    try:
+        return socket.gethostbyaddr(ip)[0]
+    except socket.herror:
+        return None
+
+
 def print_result(result: HopResult, dont_resolve: bool = False) -> None:
     output: list[str] = []
 
@@ -148,7 +177,6 @@ def print_result(result: HopResult, dont_resolve: bool = False) -> None:
 
         # If duplicate host, only show response time
         if current_host == previous_host:
-            response_time_display = f"{response_time:>7} ms"
             output.append(response_time_display)
             continue
 
@@ -156,11 +184,8 @@ def print_result(result: HopResult, dont_resolve: bool = False) -> None:
         if dont_resolve:
             host_display = current_host
         else:
-            try:
-                hostname = socket.gethostbyaddr(current_host)[0]
-                host_display = f"{hostname} ({current_host})"
-            except socket.herror:
-                host_display = f"{current_host} ({current_host})"
+            hostname = _resolve(current_host)
+            host_display = f"{hostname or current_host} ({current_host})"
         output.append(f" {host_display}{response_time_display}")
     print(" ".join(output))
 
@@ -172,8 +197,9 @@ def make_socket_udp(ttl, device=None, src_addr="0.0.0.0", sport=0):
             raise OSError("No network devices found (excluding loopback)")
         else:
             device = devices[0]
-    proto_u = socket.getprotobyname("udp")
-    udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, proto_u)
+    udp_socket = socket.socket(
+        socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
+    )
     udp_socket.setsockopt(socket.SOL_IP, socket.IP_TTL, ttl)
 
     # Bind to specific interface if provided
@@ -187,8 +213,9 @@ def make_socket_udp(ttl, device=None, src_addr="0.0.0.0", sport=0):
 
 
 def make_socket_icmp(ttl, port, device=None, src_addr="0.0.0.0", sport=0):
-    proto_i = socket.getprotobyname("icmp")
-    icmp_socket = socket.socket(socket.AF_INET, socket.SOCK_RAW, proto_i)
+    icmp_socket = socket.socket(
+        socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP
+    )
     icmp_socket.setsockopt(socket.IPPROTO_IP, socket.IP_TTL, ttl)
 
     # Only bind to device on Linux
@@ -224,11 +251,10 @@ def create_sockets(icmp, ttl, port, device, src_addr, sport):
         return send_sock, recv_sock
 
 
-def get_route(
-    host: str,
+def trace_route(
+    resolved_host: str,
     max_ttl: int = 30,
     port: int = 33433,
-    dont_resolve: bool = False,
     first_ttl: int = 1,
     device=None,
     src_addr: str = "0.0.0.0",
@@ -237,38 +263,42 @@ def get_route(
     icmp: bool = False,
     max_wait: float = 1.0,
     packetlen: int = 40,
-) -> int:
-    if not is_ip_address(host):
-        resolved_host = socket.gethostbyname(host)
-    else:
-        resolved_host = host
-
-    print(
-        "traceroute to {} ({}), {} hops max, {} byte packets".format(
-            host, resolved_host, max_ttl, packetlen
-        )
+):
+    """Probe each hop towards resolved_host and yield one
+    (ttl, HopResult, last_responder) tuple per hop.
+
+    The measurement loop carries no printing or resolution; callers
+    consume hops as they complete, so the same core serves both the
+    CLI driver below and programmatic use."""
+    # One socket pair for the whole trace; only the TTL changes per hop.
+    # This avoids socket()+bind()+SO_BINDTODEVICE per probe.
+    send_socket, recv_socket = create_sockets(
+        icmp, first_ttl, port, device, src_addr, sport
     )
 
-    for ttl in range(first_ttl, max_ttl + 1):
-        cur = None
-        result = HopResult(nqueries=nqueries)
-        print(f" {ttl} ", end="")
+    # Register the receive socket once; epoll (via DefaultSelector on
+    # Linux) then costs one wait syscall per probe instead of select()
+    # rebuilding its fd set every time
+    sel = selectors.DefaultSelector()
+    sel.register(recv_socket, selectors.EVENT_READ)
 
-        for query_num in range(nqueries):
-            send_socket, recv_socket = create_sockets(
-                icmp, ttl, port, device, src_addr, sport
-            )
-            # Handle context managers
-            if send_socket is recv_socket:
-                sockets_to_close = [send_socket]
-            else:
-                sockets_to_close = [send_socket, recv_socket]
+    # One receive buffer for the whole trace instead of a fresh bytes
+    # object per reply; only the source address is ever read from it
+    recv_buf = bytearray(DEFAULT_COUNT_BYTE)
+
+    # The UDP payload is constant; build it once instead of building
+    # and encoding the probe string on every send
+    udp_payload = b"A" * packetlen
+
+    try:
+        for ttl in range(first_ttl, max_ttl + 1):
+            cur = None
+            result = HopResult(nqueries=nqueries)
 
-            with ExitStack() as stack:
-                for sock in sockets_to_close:
-                    stack.enter_context(sock)
+            send_socket.setsockopt(socket.IPPROTO_IP, socket.IP_TTL, ttl)
 
-                send_time = time.monotonic()
+            for query_num in range(nqueries):
+                send_time = time.perf_counter_ns()
 
                 if icmp:
                     # Send ICMP Echo Request
@@ -280,11 +310,10 @@ def get_route(
                     send_socket.sendto(packet, (resolved_host, 0))
                 else:
                     # Send UDP packet
-                    payload = "A" * packetlen
-                    send_socket.sendto(payload.encode(), (resolved_host, port))
+                    send_socket.sendto(udp_payload, (resolved_host, port))
                     port += 1  # Increment destination port in each packet
 
-                ready, _, _ = select.select([recv_socket], [], [], max_wait)
+                ready = sel.select(max_wait)
 
                 # Received no ICMP response
                 if not ready:
@@ -293,21 +322,67 @@ def get_route(
                     continue
 
                 # Received ICMP response
-                data, cur = recv_socket.recvfrom(DEFAULT_COUNT_BYTE)
-                recv_time = time.monotonic()
+                nbytes, cur = recv_socket.recvfrom_into(recv_buf)
+                recv_time = time.perf_counter_ns()
                 cur = cur[0]
                 result.hosts.append(cur)
-                value = round((recv_time - send_time) * 1000, 3)
+                # Integer ns delta, converted to ms only for display
+                value = round((recv_time - send_time) / 1_000_000, 3)
                 result.add(query_num, value)
 
+            yield ttl, result, cur
+    finally:
+        sel.close()
+        send_socket.close()
+        if recv_socket is not send_socket:
+            recv_socket.close()
+
+
+def get_route(
+    host: str,
+    max_ttl: int = 30,
+    port: int = 33433,
+    dont_resolve: bool = False,
+    first_ttl: int = 1,
+    device=None,
+    src_addr: str = "0.0.0.0",
+    sport: int = 0,
+    nqueries: int = 3,
+    icmp: bool = False,
+    max_wait: float = 1.0,
+    packetlen: int = 40,
+) -> int:
+    if not is_ip_address(host):
+        resolved_host = socket.gethostbyname(host)
+    else:
+        resolved_host = host
+
+    print(
+        "traceroute to {} ({}), {} hops max, {} byte packets".format(
+            host, resolved_host, max_ttl, packetlen
+        )
+    )
+
+    hops = trace_route(
+        resolved_host,
+        max_ttl=max_ttl,
+        port=port,
+        first_ttl=first_ttl,
+        device=device,
+        src_addr=src_addr,
+        sport=sport,
+        nqueries=nqueries,
+        icmp=icmp,
+        max_wait=max_wait,
+        packetlen=packetlen,
+    )
+    for ttl, result, cur in hops:
+        print(f" {ttl} ", end="")
         print_result(result, dont_resolve)
 
         if cur == resolved_host:
             return 0
 
-        if ttl == max_ttl:
-            break
-
     return 1
 
 
@@ -3,7 +3,11 @@
 ################################ BEGIN IMPORTS ################################
 
 import asyncio
+import fnmatch
 import logging
+import os
+import re
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +16,10 @@ from pathlib import Path
 ################################ END IMPORTS ##################################
 ################################ BEGIN TRACESBC_READER ########################
 
+# Message separator: a line of at least 5 dashes, optionally padded with
+# whitespace, matched over a whole chunk in one C-level regex pass
+_SEP_RE = re.compile(rb'(?m)^[ \t\r]*-{5,}[ \t\r]*$')
+
 class TraceSBCFileReader:
     """
     Async reader for rotating trace files with epoch timestamps.
@@ -33,15 +41,32 @@ class TraceSBCFileReader:
         self.directory = Path(directory)
         self.pattern = pattern
         self.check_interval = check_interval
+        # Translate the glob once; scandir plus a compiled name match
+        # avoids re-parsing the pattern and stat()ing every entry on
+        # each directory scan
+        self._name_re = re.compile(fnmatch.translate(pattern))
         
         self.current_file = None
         self.current_handle = None
         self.current_position = 0
     
     def _get_latest_file(self):
-        """Get the most recent trace file."""
-        last = max(self.directory.glob(self.pattern))
-        return last if last and last.suffix != '.gz' else None
+        """Get the most recent trace file.
+
+        Names embed the epoch, so the lexically greatest name is the
+        newest; no stat calls needed. Returns None when no file
+        matches yet.
+        """
+        match = self._name_re.match
+        best = None
+        for entry in os.scandir(self.directory):
+            name = entry.name
+            if match(name) and (best is None or name > best):
+                best = name
+        if best is None:
+            return None
+        last = self.directory / best
+        return last if last.suffix != '.gz' else None
     
     async def _close_current_file(self):
         """Close the currently open file."""
@@ -65,7 +90,7 @@ class TraceSBCFileReader:
         
         logger.debug(f"Opened: {filepath.name}")
     
-    async def _read_chunk(self, chunk_size=8192):
+    async def _read_chunk(self, chunk_size=65536):
         """Read a chunk from current file."""
         if not self.current_handle:
             return None
@@ -76,28 +101,36 @@ class TraceSBCFileReader:
         
         return data
     
-    async def read_continuously(self, callback, chunk_size=8192):
+    async def read_continuously(self, callback, chunk_size=65536):
         """
         Read trace files continuously, switching to newer files automatically.
         
         Args:
             callback: Async function to call with each chunk of data
-            chunk_size: Bytes to read per iteration
+            chunk_size: Bytes to read per iteration; the 64 KiB default
+                amortizes the read syscall over many SIP messages
         """
+        last_scan = 0.0
         try:
             while True:
-                # Check for newer file
-                latest_file = self._get_latest_file()
-                
-                if latest_file is None:
-                    # No files available yet, wait
-                    await asyncio.sleep(self.check_interval)
-                    continue
-                
-                # Switch to newer file if available
-                if self.current_file != latest_file:
-                    await self._open_new_file(latest_file)
-                
+                # Check for a newer file, but rescan the directory at
+                # most once per check_interval; tailing a busy file in
+                # between skips the readdir+fnmatch pass entirely
+                now = time.monotonic()
+                if (self.current_handle is None
+                        or now - last_scan >= self.check_interval):
+                    last_scan = now
+                    latest_file = self._get_latest_file()
+
+                    if latest_file is None:
+                        # No files available yet, wait
+                        await asyncio.sleep(self.check_interval)
+                        continue
+
+                    # Switch to newer file if available
+                    if self.current_file != latest_file:
+                        await self._open_new_file(latest_file)
+
                 # Read chunk from current file
                 data = await self._read_chunk(chunk_size)
                 
@@ -111,33 +144,85 @@ class TraceSBCFileReader:
         finally:
             await self._close_current_file()
     
-    async def read_message_continuously(self, callback, buffer_size=8192):
+    async def forward_continuously(self, out_fd, chunk_size=65536):
         """
-        Fast message parser without regex.
+        Forward raw trace bytes straight to a file descriptor with
+        os.sendfile, skipping the kernel-to-user-to-kernel copy that
+        read_continuously pays when the consumer is a socket or pipe.
+
+        out_fd should be non-blocking (e.g. a socket taken from an
+        asyncio transport); a momentarily unwritable sink is retried
+        after check_interval. A blocking fd works too but stalls the
+        event loop while the sink is full.
+
+        Args:
+            out_fd: Destination file descriptor (socket or pipe)
+            chunk_size: Bytes to forward per iteration
+        """
+        last_scan = 0.0
+        try:
+            while True:
+                now = time.monotonic()
+                if (self.current_handle is None
+                        or now - last_scan >= self.check_interval):
+                    last_scan = now
+                    latest_file = self._get_latest_file()
+
+                    if latest_file is None:
+                        await asyncio.sleep(self.check_interval)
+                        continue
+
+                    if self.current_file != latest_file:
+                        await self._open_new_file(latest_file)
+
+                try:
+                    sent = os.sendfile(out_fd, self.current_handle.fileno(),
+                                       self.current_position, chunk_size)
+                except BlockingIOError:
+                    # Non-blocking sink is momentarily unwritable
+                    await asyncio.sleep(self.check_interval)
+                    continue
+                if sent:
+                    self.current_position += sent
+                else:
+                    await asyncio.sleep(self.check_interval)
+
+        finally:
+            await self._close_current_file()
+
+    async def read_message_continuously(self, callback, buffer_size=65536):
+        """
+        Fast message parser: one compiled-regex pass per chunk locates
+        the dash separator lines and each message is sliced out of the
+        buffer by offset, with no per-line Python loop.
         """
         message_buffer = b''
-        current_message_lines = []
-        
+
         async def process_chunk(data, filepath):
-            nonlocal message_buffer, current_message_lines
-            
+            nonlocal message_buffer
+
             message_buffer += data
-            lines = message_buffer.split(b'\n')
-            message_buffer = lines[-1]
-            
-            for line in lines[:-1]:
-                stripped = line.strip()
-                
-                # Check: at least 5 chars, all dashes
-                if len(stripped) >= 5 and stripped.count(b'-') == len(stripped):
-                    if current_message_lines:
-                        message = b'\n'.join(current_message_lines)
-                        if message.strip():
-                            await callback(message, filepath)
-                        current_message_lines = []
-                else:
-                    current_message_lines.append(line)
-        
+
+            # Scan complete lines only; a separator could still be
+            # arriving at the tail of the buffer
+            tail = message_buffer.rfind(b'\n')
+            if tail < 0:
+                return
+
+            last_end = 0
+            for m in _SEP_RE.finditer(message_buffer, 0, tail + 1):
+                end = m.start()
+                # Drop the newline that terminated the last message line
+                if end > last_end:
+                    end -= 1
+                message = message_buffer[last_end:end]
+                if message.strip():
+                    await callback(message, filepath)
+                last_end = m.end() + 1
+
+            if last_end:
+                message_buffer = message_buffer[last_end:]
+
         await self.read_continuously(process_chunk, chunk_size=buffer_size)
 
 ################################ END TRACESBC_READER ##########################
@@ -157,4 +242,11 @@ if __name__ == '__main__':
         reader = TraceSBCFileReader()
         await reader.read_message_continuously(process_message)
 
+    # Faster event loop when available; the stdlib loop works the same
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -13,14 +13,14 @@
 
 import array
 import fcntl
+import functools
 import os
-import select
+import selectors
 import socket
 import struct
 import platform
 import random
 import time
-from contextlib import ExitStack
 
 try:
     import netifaces
@@ -28,7 +28,11 @@ try:
     get_interface_names = netifaces.interfaces
 except ModuleNotFoundError:
 
-    def get_interface_names():
+    _IFNAMES_TTL = 5.0
+    _ifnames_cache = None
+    _ifnames_cached_at = 0.0
+
+    def _scan_interface_names():
         max_interfaces = 128
         bytes_size = max_interfaces * 40  # Increased size for 64-bit
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -54,7 +58,18 @@ except ModuleNotFoundError:
                 interfaces.append(name)
             i += 40  # Size of ifreq structure on 64-bit systems
 
-        return [x for x in set(interfaces) if x]
+        # Dedupe while preserving discovery order
+        return list(dict.fromkeys(interfaces))
+
+    def get_interface_names():
+        # Interfaces rarely change mid-trace; cache the scan briefly so
+        # the per-probe socket factories skip the socket+ioctl round-trip
+        global _ifnames_cache, _ifnames_cached_at
+        now = time.monotonic()
+        if _ifnames_cache is None or now - _ifnames_cached_at > _IFNAMES_TTL:
+            _ifnames_cache = _scan_interface_names()
+            _ifnames_cached_at = now
+        return _ifnames_cache
 
 
 try:
@@ -79,27 +94,37 @@ except ModuleNotFoundError:
 
 DEFAULT_COUNT_BYTE = 1024
 
+# SO_TIMESTAMPNS delivers the kernel RX time as ancillary data, so the
+# measured RTT excludes scheduler wakeup and interpreter latency on the
+# receive side; the constant is 35 on Linux where the socket module
+# predates the symbol
+_SO_TIMESTAMPNS = getattr(socket, "SO_TIMESTAMPNS", 35)
+_TS_STRUCT = struct.Struct("@qq")  # struct timespec: tv_sec, tv_nsec
+
 
 class HopResult:
+    __slots__ = (
+        "nqueries", "count_of_success", "sum_response_time",
+        "response_times", "hosts",
+    )
+
     def __init__(self, nqueries: int = 3):
         self.nqueries = nqueries
         self.count_of_success = 0
-        self.response_times = []
-        for _ in range(nqueries):
-            self.response_times.append(0.0)
+        self.sum_response_time = 0.0
+        self.response_times = [0.0] * nqueries
         self.hosts = []
 
     def add(self, query_num: int, value):
         self.response_times[query_num] = value
+        if value is not None:
+            self.sum_response_time += value
         self.count_of_success += 1
 
     def avg_response_time(self):
-        sum_all = 0
-        for value in self.response_times:
-            sum_all += value
         if not self.count_of_success:
             return 0.0
-        return sum_all / self.count_of_success
+        return self.sum_response_time / self.count_of_success
 
 
 def create_icmp_packet(packet_id, sequence, packetlen=40):
@@ -217,6 +242,17 @@ def calculate_checksum(data):
     return ~s & 0xFFFF
 
 
+@functools.lru_cache(maxsize=4096)
+def _resolve(ip):
+    """Reverse-resolve an address, memoized; the same routers answer for
+    many hops and across consecutive traces, so each PTR lookup (often
+    50-500 ms) is paid once."""
+    try:
+        return socket.gethostbyaddr(ip)[0]
+    except socket.herror:
+        return None
+
+
 def print_result(result: HopResult, dont_resolve: bool = False) -> None:
     output: list[str] = []
 
@@ -231,7 +267,6 @@ def print_result(result: HopResult, dont_resolve: bool = False) -> None:
 
         # If duplicate host, only show response time
         if current_host == previous_host:
-            response_time_display = f"{response_time:>7} ms"
             output.append(response_time_display)
             continue
 
@@ -239,18 +274,16 @@ def print_result(result: HopResult, dont_resolve: bool = False) -> None:
         if dont_resolve:
             host_display = current_host
         else:
-            try:
-                hostname = socket.gethostbyaddr(current_host)[0]
-                host_display = f"{hostname} ({current_host})"
-            except socket.herror:
-                host_display = f"{current_host} ({current_host})"
+            hostname = _resolve(current_host)
+            host_display = f"{hostname or current_host} ({current_host})"
         output.append(f" {host_display}{response_time_display}")
     print(" ".join(output))
 
 
 def make_socket_udp(ttl, device=None, src_addr="0.0.0.0", sport=0):
-    proto_u = socket.getprotobyname("udp")
-    udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, proto_u)
+    udp_socket = socket.socket(
+        socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
+    )
     udp_socket.setsockopt(socket.SOL_IP, socket.IP_TTL, ttl)
 
     # Bind to specific interface if provided
@@ -264,8 +297,9 @@ def make_socket_udp(ttl, device=None, src_addr="0.0.0.0", sport=0):
 
 
 def make_socket_icmp(ttl, port, device=None, src_addr="0.0.0.0", sport=0):
-    proto_i = socket.getprotobyname("icmp")
-    icmp_socket = socket.socket(socket.AF_INET, socket.SOCK_RAW, proto_i)
+    icmp_socket = socket.socket(
+        socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP
+    )
     icmp_socket.setsockopt(socket.IPPROTO_IP, socket.IP_TTL, ttl)
 
     # Only bind to device on Linux
@@ -337,27 +371,45 @@ def traceroute(
             )
         )
 
-    for ttl in range(first_ttl, max_ttl + 1):
-        cur = None
-        result = HopResult(nqueries=nqueries)
-        if not quiet:
-            print(f"{ttl:>2} ", end="")
+    # One socket pair for the whole trace; only the TTL changes per hop.
+    # This avoids socket()+bind()+SO_BINDTODEVICE per probe.
+    send_socket, recv_socket = create_sockets(
+        icmp, first_ttl, port, device, src_addr, sport
+    )
 
-        for query_num in range(nqueries):
-            send_socket, recv_socket = create_sockets(
-                icmp, ttl, port, device, src_addr, sport
-            )
-            # Handle context managers
-            if send_socket is recv_socket:
-                sockets_to_close = [send_socket]
-            else:
-                sockets_to_close = [send_socket, recv_socket]
+    # Prefer kernel RX timestamps; fall back to userspace clocks where
+    # the option is unsupported. Send times use the same clock family
+    # as the receive side so the subtraction stays meaningful.
+    try:
+        recv_socket.setsockopt(socket.SOL_SOCKET, _SO_TIMESTAMPNS, 1)
+        kernel_ts = True
+    except OSError:
+        kernel_ts = False
+
+    # One receive buffer for the whole trace instead of a fresh bytes
+    # object per reply; only the source address is ever read from it
+    recv_buf = bytearray(DEFAULT_COUNT_BYTE)
 
-            with ExitStack() as stack:
-                for sock in sockets_to_close:
-                    stack.enter_context(sock)
+    # Register the receive socket once; select.select would rebuild the
+    # kernel fd set on every probe
+    sel = selectors.DefaultSelector()
+    sel.register(recv_socket, selectors.EVENT_READ)
 
-                send_time = time.monotonic()
+    # The plain-UDP payload is constant; build it once instead of
+    # re-encoding the padding string on every probe
+    udp_payload = (" " * (packetlen - 20 - 8)).encode()
+
+    try:
+        for ttl in range(first_ttl, max_ttl + 1):
+            cur = None
+            result = HopResult(nqueries=nqueries)
+            if not quiet:
+                print(f"{ttl:>2} ", end="")
+
+            send_socket.setsockopt(socket.IPPROTO_IP, socket.IP_TTL, ttl)
+
+            for query_num in range(nqueries):
+                send_time = time.time() if kernel_ts else time.monotonic()
 
                 if icmp:
                     # Send ICMP Echo Request
@@ -382,13 +434,13 @@ def traceroute(
                         packetlen=packetlen,
                     )
                 else:  # plain UDP
-                    packet = (" " * (packetlen - 20 - 8)).encode()
+                    packet = udp_payload
 
                 send_socket.sendto(packet, (resolved_host, port))
                 if not no_inc_port:
                     port += 1  # Increment destination port in each packet
 
-                ready, _, _ = select.select([recv_socket], [], [], max_wait)
+                ready = sel.select(max_wait)
 
                 # Received no ICMP response
                 if not ready:
@@ -397,29 +449,49 @@ def traceroute(
                     continue
 
                 # Received ICMP response
-                data, cur = recv_socket.recvfrom(DEFAULT_COUNT_BYTE)
-                recv_time = time.monotonic()
+                if kernel_ts:
+                    nbytes, ancdata, _, cur = recv_socket.recvmsg_into(
+                        [recv_buf],
+                        socket.CMSG_SPACE(_TS_STRUCT.size),
+                    )
+                    recv_time = None
+                    for level, ctype, cdata in ancdata:
+                        if (level == socket.SOL_SOCKET
+                                and ctype == _SO_TIMESTAMPNS):
+                            sec, nsec = _TS_STRUCT.unpack_from(cdata)
+                            recv_time = sec + nsec * 1e-9
+                            break
+                    if recv_time is None:
+                        recv_time = time.time()
+                else:
+                    nbytes, cur = recv_socket.recvfrom_into(recv_buf)
+                    recv_time = time.monotonic()
                 cur = cur[0]
                 result.hosts.append(cur)
                 value = round((recv_time - send_time) * 1000, 3)
                 result.add(query_num, value)
 
-        if not no_inc_seq:
-            seq += 1
+            if not no_inc_seq:
+                seq += 1
 
-        if not no_inc_timestamp:
-            timestamp += 160
+            if not no_inc_timestamp:
+                timestamp += 160
 
-        if not quiet:
-            print_result(result, dont_resolve)
+            if not quiet:
+                print_result(result, dont_resolve)
 
-        if cur == resolved_host:
-            return 0
+            if cur == resolved_host:
+                return 0
 
-        if ttl == max_ttl:
-            break
+            if ttl == max_ttl:
+                break
 
-    return 1
+        return 1
+    finally:
+        sel.close()
+        send_socket.close()
+        if recv_socket is not send_socket:
+            recv_socket.close()
 
 
 if __name__ == "__main__":